@@ -13,14 +13,15 @@ The outcome of each round is determined using a **cyclic dominance pattern**:
 
 This dominance relationship is implemented using operator overloading (`>`, `<`, `==`) between move instances
 (`Rock()`, `Paper()`, `Scissors()`). The comparison behavior is defined in the abstract base class `BaseMove`,
-which maintains a `_dominance` mapping to express the circular logic clearly and concisely. By comparing objects
+where each concrete move names the single move it beats in `_beats`. By comparing objects
 directly (e.g., `Rock() > Scissors()`), the game logic becomes both intuitive and extensible, allowing for natural
 expression of matchups and future expandability (e.g., adding Lizard-Spock).
 
 Key Components:
-- `Move`: An enumeration defining the valid move types (ROCK, PAPER, SCISSORS).
+- `Move`: An integer enumeration defining the valid move types (ROCK, PAPER, SCISSORS) in cycle order.
 - `BaseMove`: An abstract base class for move types, encapsulating move identity and outcome logic.
 - `Rock`, `Paper`, `Scissors`: Concrete move classes inheriting from `BaseMove`.
+- `ROCK`, `PAPER`, `SCISSORS`: The shared instance of each move class.
 - `BasePlayer`: An abstract player base class that handles score tracking and move resolution.
 - `Player`: A human-controlled player.
 - `ComputerPlayer`: A computer-controlled player with randomized move selection.
@@ -36,7 +37,8 @@ Note: The `__main__` block at the end of the module is provided as an example us
 
 import random
 from abc import ABC, abstractmethod
-from enum import Enum
+from collections import Counter
+from enum import IntEnum
 from inspect import isclass
 
 
@@ -54,10 +56,11 @@ def _get_class_name(obj):
     return obj.__name__ if isclass(obj) else type(obj).__name__
 
 
-class Move(Enum):
-    ROCK = "R"
-    PAPER = "P"
-    SCISSORS = "S"
+class Move(IntEnum):
+    # Values are positions in the dominance cycle; each move beats the one right before it.
+    ROCK = 0
+    PAPER = 1
+    SCISSORS = 2
 
     @classmethod
     def get_move(cls, raw_move: str):
@@ -67,51 +70,92 @@ class Move(Enum):
                 f"Expected a string for raw_move, but got {_get_class_name(raw_move)} instead."
             )
 
-        sanitized = raw_move.strip().upper()
-        for move in cls:
-            if move.value == sanitized:
-                return move
-        raise ValueError(
-            f"Invalid move '{raw_move}'. Choose from: {[m.value for m in cls]}"
-        )
+        move = _LETTER_TO_MOVE.get(raw_move)  # Already canonical input needs no sanitizing.
+        if move is None:
+            move = _LETTER_TO_MOVE.get(raw_move.strip().upper())
+        if move is None:
+            raise ValueError(
+                f"Invalid move '{raw_move}'. Choose from: {[m.letter for m in cls]}"
+            )
+        return move
+
+    @property
+    def letter(self):
+        """The single-letter input code for this move, e.g. 'R' for ROCK."""
+        return _MOVE_LETTERS[self]
 
     def __str__(self):
         return self.name.capitalize()
 
 
+_MOVE_LETTERS = {Move.ROCK: "R", Move.PAPER: "P", Move.SCISSORS: "S"}
+_LETTER_TO_MOVE = {letter: move for move, letter in _MOVE_LETTERS.items()}
+_getrandbits = random.getrandbits
+
+# Flat 3x3 round results indexed by `a * 3 + b` over move ordinals, used for batch play:
+# 0 is a tie, 1 means a wins, 2 means b wins.
+_ROUND_RESULT = tuple((a - b) % 3 for a in range(3) for b in range(3))
+
+
 class BaseMove:
     """
     Abstract base class for Rock, Paper, and Scissors classes.
     """
 
-    _dominance = {
-        Move.ROCK: [Move.SCISSORS],  # Rock beats Scissors.
-        Move.SCISSORS: [Move.PAPER],  # Scissors beats Paper.
-        Move.PAPER: [Move.ROCK],  # Paper beats Rock.
-    }
+    __slots__ = ()
+
     _move = None
+    _beats = None
+    _instance = None
 
-    def __init__(self):
-        if self._move is None:
+    def __init_subclass__(cls, **kwargs):
+        # Validate once at class creation instead of on every instantiation.
+        super().__init_subclass__(**kwargs)
+        if cls._move is None:
             raise NotImplementedError("Subclasses must define '_move'.")
-        if not isinstance(self._move, Move):
+        if not isinstance(cls._move, Move):
+            raise TypeError(
+                f"_move must be of type Move, not {_get_class_name(cls._move)}"
+            )
+        if not isinstance(cls._beats, Move):
             raise TypeError(
-                f"_move must be of type Move, not {_get_class_name(self._move)}"
+                f"_beats must be of type Move, not {_get_class_name(cls._beats)}"
             )
+        cls._str = str(cls._move)
+
+    def __new__(cls):
+        # One shared instance per move class; moves carry no per-instance state.
+        inst = cls.__dict__.get("_instance")
+        if inst is None:
+            if cls._move is None:
+                raise NotImplementedError("Subclasses must define '_move'.")
+            inst = super().__new__(cls)
+            cls._instance = inst
+        return inst
 
     def __eq__(self, other):
-        self._assert_comparable(other)
-        return self._move == other._move
+        try:
+            return self._move is other._move
+        except AttributeError:
+            self._assert_comparable(other)
+            raise
 
     def __gt__(self, other):
-        self._assert_comparable(other)
-        return other._move in self._dominance.get(self._move, [])
+        try:
+            return other._move is self._beats
+        except AttributeError:
+            self._assert_comparable(other)
+            raise
 
     def __lt__(self, other):
-        return not (self > other or self == other)
+        try:
+            return self._move is other._beats
+        except AttributeError:
+            self._assert_comparable(other)
+            raise
 
     def __str__(self):
-        return self._move.name.capitalize()
+        return self._str
 
     def __hash__(self):
         return hash(self._move)
@@ -125,32 +169,56 @@ class BaseMove:
 
 
 class Rock(BaseMove):
+    __slots__ = ()
     _move = Move.ROCK
+    _beats = Move.SCISSORS  # Rock beats Scissors.
 
 
 class Paper(BaseMove):
+    __slots__ = ()
     _move = Move.PAPER
+    _beats = Move.ROCK  # Paper beats Rock.
 
 
 class Scissors(BaseMove):
+    __slots__ = ()
     _move = Move.SCISSORS
+    _beats = Move.PAPER  # Scissors beats Paper.
+
+
+# Each move class has a single shared instance; these are the same objects `Rock()` etc. return.
+ROCK = Rock()
+PAPER = Paper()
+SCISSORS = Scissors()
+
+_MOVE_FROM_ENUM = {
+    Move.ROCK: ROCK,
+    Move.PAPER: PAPER,
+    Move.SCISSORS: SCISSORS,
+}
+_MOVE_FROM_IDX = (ROCK, PAPER, SCISSORS)
+_MOVE_FROM_STR = {move.letter: instance for move, instance in _MOVE_FROM_ENUM.items()}
 
 
 class BasePlayer(ABC):
+    __slots__ = ("_name", "_display_name", "_score", "last_move")
+
     def __init__(self, name=None):
         self._name = name if isinstance(name, str) else str(id(self))
+        self._display_name = self._name.title()
         self._score = 0
         self.last_move = None
 
     def win(self):
         self._score += 1
+        return self._score
 
     def reset_score(self):
         self._score = 0
 
     @property
     def name(self):
-        return self._name.title()
+        return self._display_name
 
     @property
     def score(self):
@@ -161,19 +229,19 @@ class BasePlayer(ABC):
 
     @staticmethod
     def _resolve_move(move: str | BaseMove | Move):
+        if move.__class__ is str:
+            move_instance = _MOVE_FROM_STR.get(move)
+            if move_instance is None:
+                move_instance = _MOVE_FROM_STR.get(move.strip().upper())
+            if move_instance is not None:
+                return move_instance
         if isinstance(move, BaseMove):
             return move
         if isinstance(move, Move):
-            match move:
-                case Move.ROCK:
-                    return Rock()
-                case Move.PAPER:
-                    return Paper()
-                case Move.SCISSORS:
-                    return Scissors()
+            return _MOVE_FROM_ENUM[move]
         if isinstance(move, str):
-            move_enum = Move.get_move(move)
-            return BasePlayer._resolve_move(move_enum)
+            # Unknown letters (and str subclasses) go through get_move for its validation and error message.
+            return _MOVE_FROM_ENUM[Move.get_move(move)]
 
         raise TypeError(f"Invalid move type: {_get_class_name(move)}")
 
@@ -184,23 +252,38 @@ class BasePlayer(ABC):
 
 
 class Player(BasePlayer):
+    __slots__ = ()
 
     def make_move(self, move):
-        move_instance = self._resolve_move(move)
+        # The CLI passes Move members; map them directly before falling back to full resolution.
+        if move.__class__ is Move:
+            move_instance = _MOVE_FROM_ENUM[move]
+        else:
+            move_instance = self._resolve_move(move)
         self.last_move = move_instance
         return move_instance
 
 
 class ComputerPlayer(BasePlayer):
+    __slots__ = ()
+
     def __init__(self, name=None):
         super().__init__(name)
         if not name or not name.lower().startswith("computer"):
             self._name = f"Computer {self._name}"
+            self._display_name = self._name.title()
 
     def make_move(self, move=None):
         if move is None:
-            move = random.choice(list(Move))  # choose a Move enum, not a string
-        move_instance = self._resolve_move(move)
+            # Draw 2 random bits and reject 3 for a uniform pick among the three moves.
+            idx = _getrandbits(2)
+            while idx == 3:
+                idx = _getrandbits(2)
+            move_instance = _MOVE_FROM_IDX[idx]
+        elif move.__class__ is Move:
+            move_instance = _MOVE_FROM_ENUM[move]
+        else:
+            move_instance = self._resolve_move(move)
         self.last_move = move_instance
         return move_instance
 
@@ -214,14 +297,59 @@ class RPSGame:
         self.winner_score = winner_score
 
     def play_one_hand(self, player1_move=None, player2_move=None):
-        move1 = self.player1.make_move(player1_move)
-        move2 = self.player2.make_move(player2_move)
+        """Play a single round and return the player who won it, or None on a tie."""
+        player1 = self.player1
+        player2 = self.player2
+        move1 = player1.make_move(player1_move)
+        move2 = player2.make_move(player2_move)
+
+        # Determine result: 0 is a tie, 1 means move1 wins, 2 means move2 wins.
+        result = (move1._move - move2._move) % 3
+        if result == 1:
+            player1._score += 1
+            return player1
+        if result == 2:
+            player2._score += 1
+            return player2
+        return None
+
+    def play_many(self, n: int, seed=None):
+        """
+        Play n rounds with uniformly random moves for both players.
+
+        Intended for simulations: rounds are sampled in bulk without calling make_move, and scores
+        keep accumulating past winner_score. Each player's last_move is set to the final round's move.
+        Pass a seed for a reproducible run that leaves the global random state untouched.
+
+        Returns:
+            tuple[int, int, int]: Player 1 wins, player 2 wins, and ties over the n rounds.
+        """
+        if n < 0:
+            raise ValueError(f"Number of rounds must be non-negative, got {n}.")
+        if not n:
+            return 0, 0, 0
+
+        rng = random if seed is None else random.Random(seed)
+        # Each round is sampled as one result-table index `a * 3 + b`.
+        rounds = rng.choices(range(9), k=n)
+        ties, p1_wins, p2_wins = self._tally_rounds(rounds)
+
+        player1 = self.player1
+        player2 = self.player2
+        player1._score += p1_wins
+        player2._score += p2_wins
+        last_move1, last_move2 = divmod(rounds[-1], 3)
+        player1.last_move = _MOVE_FROM_IDX[last_move1]
+        player2.last_move = _MOVE_FROM_IDX[last_move2]
+        return p1_wins, p2_wins, ties
 
-        # Determine result
-        if move1 > move2:
-            self.player1.win()
-        elif move2 > move1:
-            self.player2.win()
+    @staticmethod
+    def _tally_rounds(rounds):
+        """Return [ties, player1 wins, player2 wins] for a sequence of result-table indices."""
+        tallies = [0, 0, 0]
+        for pair, count in Counter(rounds).items():
+            tallies[_ROUND_RESULT[pair]] += count
+        return tallies
 
     def get_winner(self):
         if self.player1.score >= self.winner_score:
@@ -243,14 +371,14 @@ if __name__ == "__main__":
     while play_again:
         try:
             user_input = input(
-                f"Enter your move ({', '.join(m.value for m in Move)}): "
+                f"Enter your move ({', '.join(m.letter for m in Move)}): "
             )
             player_move = Move.get_move(user_input)
         except ValueError as e:
             print(e)
             continue
 
-        game.play_one_hand(player_move)
+        round_winner = game.play_one_hand(player_move)
 
         print(
             f"{game.player1.name}: {game.player1.last_move}\t{game.player2.name}: {game.player2.last_move}"
@@ -259,11 +387,11 @@ if __name__ == "__main__":
             f"{game.player1.name}: {game.player1.score},\t{game.player2.name}: {game.player2.score}"
         )
 
-        winner = game.get_winner()
-        if winner is None:
+        # Only the player who just won the round can have reached the winning score.
+        if round_winner is None or round_winner.score < game.winner_score:
             continue  # No winner yet, loop again
 
-        print(f"{winner.name} wins the game with {winner.score} points!")
+        print(f"{round_winner.name} wins the game with {round_winner.score} points!")
 
         response = (
             input("Type 'Y' to play again, or anything else to quit: ").strip().upper()
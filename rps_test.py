@@ -1,51 +1,73 @@
 import unittest
-import rps as _rps
-
-
-class TestRPSComparison(unittest.TestCase):
+from itertools import cycle
+from unittest import mock
 
-    def setUp(self):
-        self.rock = _rps.Rock()
-        self.paper = _rps.Paper()
-        self.scissors = _rps.Scissors()
+import rps as _rps
 
-    def test_initialization_errors(self):
-        # Case 1: _move is not set (None) → NotImplementedError
-        class NoneValue(_rps.BaseMove):
-            pass
 
-        with self.assertRaises(NotImplementedError):
-            NoneValue()
+def _raises(tc, exc, fn, *args, **kwargs):
+    """Fail tc unless fn(*args, **kwargs) raises exc; a lighter stand-in for assertRaises."""
+    try:
+        fn(*args, **kwargs)
+    except exc:
+        return
+    tc.fail(f"{exc.__name__} not raised")
 
-        # Case 2: _move is not a Move enum  → TypeError
-        class NotEnumValue(_rps.BaseMove):
-            _move = 1234
 
-        with self.assertRaises(TypeError):
-            NotEnumValue()
+# (name, class namespace, expected error) for BaseMove subclasses that must be rejected.
+# BaseMove validates subclasses when they are created, so these cannot be defined as classes up front.
+_INVALID_MOVE_SUBCLASSES = (
+    ("NoneValue", {}, NotImplementedError),  # _move is not set (None)
+    ("NotEnumValue", {"_move": 1234}, TypeError),  # _move is not a Move enum
+    ("NoBeatsValue", {"_move": _rps.Move.ROCK}, TypeError),  # _beats is not a Move enum
+)
 
-    def test_greater_than(self):
-        self.assertGreater(self.rock, self.scissors)
-        self.assertGreater(self.scissors, self.paper)
-        self.assertGreater(self.paper, self.rock)
 
-        self.assertFalse(self.scissors > self.rock)
-        self.assertFalse(self.paper > self.scissors)
-        self.assertFalse(self.rock > self.paper)
+class TestRPSComparison(unittest.TestCase):
 
-    def test_less_than(self):
-        self.assertLess(self.scissors, self.rock)
-        self.assertLess(self.paper, self.scissors)
-        self.assertLess(self.rock, self.paper)
+    # (a, b, expected_cmp): +1 when a beats b, -1 when b beats a.
+    CMP_TABLE = (
+        ("rock", "scissors", +1),
+        ("scissors", "paper", +1),
+        ("paper", "rock", +1),
+        ("scissors", "rock", -1),
+        ("paper", "scissors", -1),
+        ("rock", "paper", -1),
+    )
+
+    @classmethod
+    def setUpClass(cls):
+        cls.rock = _rps.ROCK
+        cls.paper = _rps.PAPER
+        cls.scissors = _rps.SCISSORS
 
-        self.assertFalse(self.rock < self.scissors)
-        self.assertFalse(self.scissors < self.paper)
-        self.assertFalse(self.paper < self.rock)
+    def test_initialization_errors(self):
+        # Subclasses are validated when the class is defined.
+        for name, namespace, exc in _INVALID_MOVE_SUBCLASSES:
+            with self.subTest(name=name):
+                _raises(self, exc, type, name, (_rps.BaseMove,), namespace)
+
+        # BaseMove itself has no move → NotImplementedError
+        _raises(self, NotImplementedError, _rps.BaseMove)
+
+    def test_greater_and_less_than(self):
+        for a, b, expected_cmp in self.CMP_TABLE:
+            with self.subTest(a=a, b=b):
+                first, second = getattr(self, a), getattr(self, b)
+                self.assertEqual(
+                    (first > second, first < second, first == second),
+                    (expected_cmp > 0, expected_cmp < 0, False),
+                )
 
     def test_equal(self):
-        self.assertEqual(self.rock, _rps.Rock())
-        self.assertEqual(self.paper, _rps.Paper())
-        self.assertEqual(self.scissors, _rps.Scissors())
+        self.assertEqual(self.rock, _rps.ROCK)
+        self.assertEqual(self.paper, _rps.PAPER)
+        self.assertEqual(self.scissors, _rps.SCISSORS)
+
+    def test_singleton_instances(self):
+        self.assertIs(self.rock, _rps.Rock())
+        self.assertIs(self.paper, _rps.Paper())
+        self.assertIs(self.scissors, _rps.Scissors())
 
     def test_not_equal(self):
         self.assertNotEqual(self.rock, self.paper)
@@ -55,6 +77,14 @@ class TestRPSComparison(unittest.TestCase):
 
 class TestPlayers(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # Shared by tests that only resolve moves; tests that change the score build their own players.
+        cls._players = (_rps.Player(), _rps.ComputerPlayer())
+        cls._player_classes = (_rps.Player, _rps.ComputerPlayer)
+        cls._raw_name = "pyTHON COder"
+        cls._title_name = "Python Coder"
+
     def base_player_initialization_error(self):
         with self.assertRaises(
             TypeError, msg="BasePlayer should not be instantiable directly"
@@ -65,12 +95,14 @@ class TestPlayers(unittest.TestCase):
 
     def test_score(self):
         # checking both player and computer player score changing
-        for player in [_rps.Player(), _rps.ComputerPlayer()]:
-            self.assertEqual(player.score, 0)
-            player.win()
-            self.assertEqual(player.score, 1)
-            player.win()
-            self.assertEqual(player.score, 2)
+        for player_cls in self._player_classes:
+            with self.subTest(player_cls=player_cls.__name__):
+                player = player_cls()
+                self.assertEqual(player.score, 0)
+                self.assertEqual(player.win(), 1)
+                self.assertEqual(player.score, 1)
+                self.assertEqual(player.win(), 2)
+                self.assertEqual(player.score, 2)
 
     def test_computer_player_name(self):
         computer1 = _rps.ComputerPlayer()
@@ -80,50 +112,78 @@ class TestPlayers(unittest.TestCase):
 
     def test_player_name(self):
         # name attr should return .title()
-        test_name = "pyTHON COder"
-
         player1 = _rps.Player()
-        player2 = _rps.Player(test_name)
+        player2 = _rps.Player(self._raw_name)
         self.assertEqual(player1.name, str(id(player1)))
-        self.assertEqual(player2.name, test_name.title())
+        self.assertEqual(player2.name, self._title_name)
 
     def test_move_resolution_from_str(self):
         # checking both player and computer player's make_move resolution from string
-        for player in [_rps.Player(), _rps.ComputerPlayer()]:
-            self.assertIsInstance(player.make_move("r"), _rps.Rock)
-            self.assertIsInstance(player.make_move("P"), _rps.Paper)
-            self.assertIsInstance(player.make_move("s"), _rps.Scissors)
+        for player in self._players:
+            with self.subTest(player=type(player).__name__):
+                self.assertIsInstance(player.make_move("r"), _rps.Rock)
+                self.assertIsInstance(player.make_move("P"), _rps.Paper)
+                self.assertIsInstance(player.make_move("s"), _rps.Scissors)
+
+    def test_move_resolution_from_enum(self):
+        # checking both player and computer player's make_move resolution from Move members
+        for player in self._players:
+            with self.subTest(player=type(player).__name__):
+                self.assertIsInstance(player.make_move(_rps.Move.ROCK), _rps.Rock)
+                self.assertIsInstance(player.make_move(_rps.Move.PAPER), _rps.Paper)
+                self.assertIsInstance(player.make_move(_rps.Move.SCISSORS), _rps.Scissors)
+                self.assertIs(player.last_move, _rps.Scissors())
 
     def test_move_resolution_from_instance(self):
         # checking both player and computer player's make_move resolution from instances
-        for player in [_rps.Player(), _rps.ComputerPlayer()]:
-            self.assertIsInstance(player.make_move(_rps.Rock()), _rps.Rock)
-            self.assertIsInstance(player.make_move(_rps.Paper()), _rps.Paper)
-            self.assertIsInstance(player.make_move(_rps.Scissors()), _rps.Scissors)
+        for player in self._players:
+            with self.subTest(player=type(player).__name__):
+                self.assertIsInstance(player.make_move(_rps.Rock()), _rps.Rock)
+                self.assertIsInstance(player.make_move(_rps.Paper()), _rps.Paper)
+                self.assertIsInstance(player.make_move(_rps.Scissors()), _rps.Scissors)
 
     def test_invalid_move(self):
         # checking both player and computer player's make_move raising errors
-        for player in [_rps.Player(), _rps.ComputerPlayer()]:
-            with self.assertRaises(ValueError):
-                player.make_move("X")
-            with self.assertRaises(TypeError):
-                player.make_move(123)
+        for player in self._players:
+            with self.subTest(player=type(player).__name__):
+                _raises(self, ValueError, player.make_move, "X")
+                _raises(self, TypeError, player.make_move, 123)
 
     def test_computer_random_move(self):
         computer = _rps.ComputerPlayer()
-        moves = set()
 
-        for _ in range(100):  # Used 100 iterations to reduce randomness bias
-            move = computer.make_move()
-            self.assertIsInstance(move, _rps.BaseMove)
-            moves.add(move)
+        # The leading 3 must be rejected and redrawn; 0, 1, 2 map to Rock, Paper, Scissors.
+        with mock.patch("rps._getrandbits", side_effect=cycle([3, 0, 1, 2])):
+            moves = [type(computer.make_move()) for _ in range(3)]
+
+        self.assertEqual(moves, [_rps.Rock, _rps.Paper, _rps.Scissors])
 
-        # Confirm that all 3 move types were used
-        self.assertEqual(moves, {_rps.Rock(), _rps.Paper(), _rps.Scissors()})
+    def test_computer_random_move_covers_all_moves(self):
+        # Unpatched RNG: stop as soon as every move type has been drawn (about 5.5 draws on average).
+        computer = _rps.ComputerPlayer()
+        moves = set()
+        for _ in range(100):
+            moves.add(type(computer.make_move()))
+            if len(moves) == 3:
+                break
+        else:
+            self.fail("did not observe all three move types in 100 draws")
+        self.assertEqual(moves, {_rps.Rock, _rps.Paper, _rps.Scissors})
 
 
 class TestRPSGame(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # Shared by the round-playing tests; setUp clears the state they change.
+        cls.p1 = _rps.Player("Player1")
+        cls.p2 = _rps.Player("Player2")
+        cls.game = _rps.RPSGame(cls.p1, cls.p2)
+
+    def setUp(self):
+        self.game.reset_scores()
+        self.game.winner_score = 2
+
     def test_default_initialization(self):
         game = _rps.RPSGame()
         self.assertIsInstance(game.player1, _rps.ComputerPlayer)
@@ -140,27 +200,58 @@ class TestRPSGame(unittest.TestCase):
         self.assertEqual(game.winner_score, 5)
 
     def test_draw_does_not_affect_score(self):
-        p1 = _rps.Player("DrawTester1")
-        p2 = _rps.Player("DrawTester2")
-        game = _rps.RPSGame(p1, p2, winner_score=1)
+        p1, p2, game = self.p1, self.p2, self.game
+        game.winner_score = 1
 
-        game.play_one_hand(_rps.Move.ROCK, _rps.Move.ROCK)
-        game.play_one_hand(_rps.Move.PAPER, _rps.Move.PAPER)
-        game.play_one_hand(_rps.Move.SCISSORS, _rps.Move.SCISSORS)
+        self.assertIsNone(game.play_one_hand(_rps.Move.ROCK, _rps.Move.ROCK))
+        self.assertIsNone(game.play_one_hand(_rps.Move.PAPER, _rps.Move.PAPER))
+        self.assertIsNone(game.play_one_hand(_rps.Move.SCISSORS, _rps.Move.SCISSORS))
 
         self.assertEqual(p1.score, 0)
         self.assertEqual(p2.score, 0)
         self.assertIsNone(game.get_winner())
 
     def test_get_winner_with_second_player_winning(self):
-        p1 = _rps.Player("Player1")
-        p2 = _rps.Player("Player2")
-        game = _rps.RPSGame(p1, p2, winner_score=2)
+        p1, p2, game = self.p1, self.p2, self.game
 
-        game.play_one_hand(_rps.Move.SCISSORS, _rps.Move.ROCK)  # Player2 wins
-        game.play_one_hand(_rps.Move.PAPER, _rps.Move.SCISSORS)  # Player2 wins
+        self.assertIs(game.play_one_hand(_rps.Move.SCISSORS, _rps.Move.ROCK), p2)
+        self.assertIs(game.play_one_hand(_rps.Move.PAPER, _rps.Move.SCISSORS), p2)
         self.assertEqual(game.get_winner(), p2)
 
+    def test_get_winner_with_first_player_winning(self):
+        p1, p2, game = self.p1, self.p2, self.game
+
+        self.assertIs(game.play_one_hand(_rps.Move.ROCK, _rps.Move.SCISSORS), p1)
+        self.assertIs(game.play_one_hand(_rps.Move.SCISSORS, _rps.Move.PAPER), p1)
+        self.assertEqual(p2.score, 0)
+        self.assertEqual(game.get_winner(), p1)
+
+    def test_play_many(self):
+        p1 = _rps.ComputerPlayer()
+        p2 = _rps.ComputerPlayer()
+        game = _rps.RPSGame(p1, p2)
+
+        self.assertEqual(game.play_many(0), (0, 0, 0))
+        self.assertEqual((p1.score, p2.score), (0, 0))
+        self.assertIsNone(p1.last_move)
+
+        p1_wins, p2_wins, ties = game.play_many(1000)
+        self.assertEqual(p1_wins + p2_wins + ties, 1000)
+        self.assertEqual((p1.score, p2.score), (p1_wins, p2_wins))
+        self.assertGreater(p1.score, 0)
+        self.assertGreater(p2.score, 0)
+        self.assertIsInstance(p1.last_move, _rps.BaseMove)
+        self.assertIsInstance(p2.last_move, _rps.BaseMove)
+
+        _raises(self, ValueError, game.play_many, -1)
+
+    def test_play_many_seeded(self):
+        game = _rps.RPSGame()
+        self.assertEqual(game.play_many(500, seed=7), game.play_many(500, seed=7))
+
 
 if __name__ == "__main__":
-    unittest.main()
+    # dir() already yields method names in a stable order, so skip the loader's extra sort pass.
+    loader = unittest.TestLoader()
+    loader.sortTestMethodsUsing = None
+    unittest.main(testLoader=loader)